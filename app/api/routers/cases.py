@@ -1,98 +1,50 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import List, Type
+import httpx
+from fastapi import APIRouter, HTTPException
 
 from models import (
     CaseNumberSearchRequest, ComplainantSearchRequest, RespondentSearchRequest,
     ComplainantAdvocateSearchRequest, RespondentAdvocateSearchRequest,
-    IndustryTypeSearchRequest, JudgeSearchRequest, CaseResponse, SearchType
+    IndustryTypeSearchRequest, JudgeSearchRequest, CaseResponse, SearchType,
+    CaseSearchRequest
 )
-from services import JagritiService
-from utils import validate_search_value
-from app.deps import get_jagriti_service
+from app.deps import ServiceDep
 
 
 router = APIRouter(tags=["cases"])
 
-
-@router.post("/by-case-number", response_model=List[CaseResponse])
-async def search_by_case_number(request: CaseNumberSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.CASE_NUMBER)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-complainant", response_model=List[CaseResponse])
-async def search_by_complainant(request: ComplainantSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.COMPLAINANT)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-respondent", response_model=List[CaseResponse])
-async def search_by_respondent(request: RespondentSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.RESPONDENT)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-complainant-advocate", response_model=List[CaseResponse])
-async def search_by_complainant_advocate(request: ComplainantAdvocateSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.COMPLAINANT_ADVOCATE)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-respondent-advocate", response_model=List[CaseResponse])
-async def search_by_respondent_advocate(request: RespondentAdvocateSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.RESPONDENT_ADVOCATE)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-industry-type", response_model=List[CaseResponse])
-async def search_by_industry_type(request: IndustryTypeSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.INDUSTRY_TYPE)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
-
-
-@router.post("/by-judge", response_model=List[CaseResponse])
-async def search_by_judge(request: JudgeSearchRequest, service: JagritiService = Depends(get_jagriti_service)):
-    if not validate_search_value(request.search_value):
-        raise HTTPException(status_code=400, detail="Invalid search value")
-    try:
-        return await service.search_cases(request, SearchType.JUDGE)
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception:
-        raise HTTPException(status_code=500, detail="Search failed")
+# (path, request model, search type); search values are validated by the models
+_SEARCH_SPECS = [
+    ("by-case-number", CaseNumberSearchRequest, SearchType.CASE_NUMBER),
+    ("by-complainant", ComplainantSearchRequest, SearchType.COMPLAINANT),
+    ("by-respondent", RespondentSearchRequest, SearchType.RESPONDENT),
+    ("by-complainant-advocate", ComplainantAdvocateSearchRequest,
+     SearchType.COMPLAINANT_ADVOCATE),
+    ("by-respondent-advocate", RespondentAdvocateSearchRequest,
+     SearchType.RESPONDENT_ADVOCATE),
+    ("by-industry-type", IndustryTypeSearchRequest, SearchType.INDUSTRY_TYPE),
+    ("by-judge", JudgeSearchRequest, SearchType.JUDGE),
+]
+
+
+def _make_handler(path: str, model: Type[CaseSearchRequest], search_type: SearchType):
+    async def handler(request: model, service: ServiceDep):
+        try:
+            return await service.search_cases(request, search_type)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except httpx.HTTPError:
+            raise HTTPException(status_code=502, detail="Upstream error")
+
+    # Keep the original function names so OpenAPI operation IDs are unchanged
+    handler.__name__ = "search_" + path.replace("-", "_")
+    return handler
+
+
+for path, model, search_type in _SEARCH_SPECS:
+    router.add_api_route(
+        f"/{path}",
+        _make_handler(path, model, search_type),
+        methods=["POST"],
+        response_model=List[CaseResponse],
+    )
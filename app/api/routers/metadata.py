@@ -1,26 +1,46 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+import hashlib
+import httpx
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response
 
-from services import JagritiService
 from models import StateResponse, CommissionResponse
-from app.deps import get_jagriti_service
+from config import Config
+from app.deps import ServiceDep
 
 
 router = APIRouter(tags=["metadata"])
 
 
+def _conditional_response(request: Request, items: list) -> Response:
+    """Serialize items with an ETag, answering 304 if the client already has them"""
+    body = orjson.dumps([item.model_dump() for item in items])
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+    # Empty lists usually mean an upstream failure; don't let clients keep them
+    if items:
+        headers["Cache-Control"] = f"public, max-age={Config.CACHE_TTL}"
+
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 @router.get("/states", response_model=List[StateResponse])
-async def get_states(service: JagritiService = Depends(get_jagriti_service)):
+async def get_states(request: Request, service: ServiceDep):
     try:
-        return await service.get_states()
-    except Exception:
-        raise HTTPException(status_code=500, detail="Failed to fetch states")
+        states = await service.get_states()
+    except httpx.HTTPError:
+        raise HTTPException(status_code=502, detail="Failed to fetch states")
+    return _conditional_response(request, states)
 
 
 @router.get("/commissions/{state_id}", response_model=List[CommissionResponse])
-async def get_commissions(state_id: str, service: JagritiService = Depends(get_jagriti_service)):
+async def get_commissions(state_id: str, request: Request, service: ServiceDep):
     try:
-        return await service.get_commissions(state_id)
-    except Exception:
+        commissions = await service.get_commissions(state_id)
+    except httpx.HTTPError:
         raise HTTPException(
-            status_code=500, detail="Failed to fetch commissions")
+            status_code=502, detail="Failed to fetch commissions")
+    return _conditional_response(request, commissions)
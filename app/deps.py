@@ -1,6 +1,12 @@
-from fastapi import Request
+from typing import Annotated
+from fastapi import Depends, Request
 from services import JagritiService
 
 
+# Kept async: FastAPI runs plain `def` dependencies in the threadpool, which
+# would cost more per request than the coroutine it replaces
 async def get_jagriti_service(request: Request) -> JagritiService:
     return request.app.state.jagriti_service
+
+
+ServiceDep = Annotated[JagritiService, Depends(get_jagriti_service)]
@@ -1,39 +1,69 @@
 import os
+import sys
+from dataclasses import dataclass
+from typing import Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-class Config:
+@dataclass(frozen=True, slots=True)
+class _Config:
     # Jagriti portal settings
-    JAGRITI_BASE_URL = "https://e-jagriti.gov.in"
-    JAGRITI_SEARCH_URL = f"{JAGRITI_BASE_URL}/advance-case-search"
+    JAGRITI_BASE_URL: str = "https://e-jagriti.gov.in"
+    JAGRITI_SEARCH_URL: str = f"{JAGRITI_BASE_URL}/advance-case-search"
     # Main search endpoint
-    JAGRITI_API_URL = f"{JAGRITI_BASE_URL}/advance-case-search"
+    JAGRITI_API_URL: str = f"{JAGRITI_BASE_URL}/advance-case-search"
 
     # API settings
-    API_TITLE = "Lexi Jagriti API"
-    API_VERSION = "1.0.0"
-    API_DESCRIPTION = "API for searching District Consumer Court cases via Jagriti portal"
+    API_TITLE: str = "Lexi Jagriti API"
+    API_VERSION: str = "1.0.0"
+    API_DESCRIPTION: str = "API for searching District Consumer Court cases via Jagriti portal"
 
     # Request settings
-    REQUEST_TIMEOUT = 30
-    MAX_RETRIES = 3
+    REQUEST_TIMEOUT: int = 30
+    MAX_RETRIES: int = 3
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KEEPALIVE_EXPIRY: float = 30.0  # seconds
+    WARMUP_TIMEOUT: float = 5.0  # seconds startup waits on the portal
+
+    # Response compression
+    GZIP_MIN_SIZE: int = 1024  # bytes
 
     # Cache settings (for state/commission mappings)
-    CACHE_TTL = 3600  # 1 hour
+    CACHE_TTL: int = 3600  # 1 hour
+    SEARCH_CACHE_TTL: int = 60  # identical case searches
+    CACHE_MAXSIZE: int = 1024
+    DOCUMENT_CACHE_SIZE: int = 32  # decoded documents kept in memory
+    # Encoded documents behind document links, bounded by total base64 chars;
+    # outlives SEARCH_CACHE_TTL so links in cached search results resolve
+    DOCUMENT_STORE_MAX_CHARS: int = 128 * 1024 * 1024
+    DOCUMENT_STORE_TTL: int = 600
+    # Larger base64 documents are dropped; ~3 MB decoded, so the decoded
+    # cache stays under ~100 MB
+    MAX_DOC_B64_LEN: int = 4 * 1024 * 1024
+    DOC_DECODE_THREAD_MIN: int = 512 * 1024  # hash/decode in a worker thread above this
 
     # Environment
-    ENV = os.getenv("ENV", "development")
-    DEBUG = os.getenv("DEBUG", "true").lower() == "true"
+    ENV: str = os.getenv("ENV", "development")
+    DEBUG: bool = os.getenv("DEBUG", "true").lower() == "true"
 
     # Server settings
-    HOST = os.getenv("HOST", "0.0.0.0")
-    PORT = int(os.getenv("PORT", 8000))
+    HOST: str = os.getenv("HOST", "0.0.0.0")
+    PORT: int = int(os.getenv("PORT", 8000))
+    # Documents are stored per process, so links only resolve on the worker
+    # that served the search; keep one worker unless that changes
+    WORKERS: int = int(os.getenv("WORKERS", 1))
+    # uvloop is not available on Windows
+    EVENT_LOOP: str = "asyncio" if sys.platform == "win32" else "uvloop"
 
     # CORS
-    CORS_ALLOW_ORIGINS = (
-        os.getenv("CORS_ALLOW_ORIGINS", "*").split(",")
+    CORS_ALLOW_ORIGINS: Tuple[str, ...] = (
+        tuple(os.getenv("CORS_ALLOW_ORIGINS").split(","))
         if os.getenv("CORS_ALLOW_ORIGINS")
-        else ["*"]
+        else ("*",)
     )
+
+
+Config = _Config()
@@ -1,32 +1,51 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from typing import List
+from contextlib import asynccontextmanager
+import asyncio
 import logging
 
-from models import (
-    ErrorResponse
-)
 from services import JagritiService
 from config import Config
 from app.api.routers.metadata import router as metadata_router
 from app.api.routers.cases import router as cases_router
-from app.deps import get_jagriti_service
+from app.deps import ServiceDep
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    service = JagritiService()
+    # Bounded so a slow or unreachable portal can't stall worker boot;
+    # the states fetch carries on in the background if it times out
+    try:
+        await asyncio.wait_for(service.warmup(), Config.WARMUP_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Warmup did not finish within %ss; starting anyway", Config.WARMUP_TIMEOUT)
+    app.state.jagriti_service = service
+    yield
+    await service.close()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title=Config.API_TITLE,
     version=Config.API_VERSION,
     description=Config.API_DESCRIPTION,
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 
@@ -40,6 +59,22 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class CompressionMiddleware(GZipMiddleware):
+    """GZip JSON responses, leaving already-compressed PDF documents alone"""
+    EXCLUDED_PREFIXES = ("/documents/",)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"].startswith(self.EXCLUDED_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Added first so it sits inside SecurityHeadersMiddleware and sees the
+# complete body (BaseHTTPMiddleware re-streams it, defeating minimum_size)
+app.add_middleware(CompressionMiddleware,
+                   minimum_size=Config.GZIP_MIN_SIZE, compresslevel=5)
+
 app.add_middleware(SecurityHeadersMiddleware)
 
 app.add_middleware(
@@ -51,29 +86,28 @@ app.add_middleware(
 )
 
 
+# Error bodies follow the ErrorResponse schema; built as plain dicts so the
+# handlers don't instantiate and re-dump a model per error
+_BAD_REQUEST_ERROR = {"error": "Bad Request", "status_code": 400}
+_INTERNAL_ERROR = {
+    "error": "Internal Server Error",
+    "message": "An unexpected error occurred",
+    "status_code": 500
+}
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400,
-        content=ErrorResponse(
-            error="Bad Request",
-            message=str(exc),
-            status_code=400
-        ).dict()
+        content={**_BAD_REQUEST_ERROR, "message": str(exc)}
     )
 
 
 @app.exception_handler(Exception)
 async def general_exception_handler(request, exc):
-    logger.error(f"Unexpected error: {str(exc)}")
-    return JSONResponse(
-        status_code=500,
-        content=ErrorResponse(
-            error="Internal Server Error",
-            message="An unexpected error occurred",
-            status_code=500
-        ).dict()
-    )
+    logger.error("Unexpected error: %s", exc)
+    return ORJSONResponse(status_code=500, content=_INTERNAL_ERROR)
 
 # Health check endpoint
 
@@ -88,27 +122,17 @@ async def health_check():
 app.include_router(metadata_router)
 app.include_router(cases_router, prefix="/cases")
 
-# Case search endpoints
-
-
-@app.on_event("startup")
-async def on_startup():
-    app.state.jagriti_service = JagritiService()
-
-# Shutdown event
-
-
-@app.on_event("shutdown")
-async def shutdown_event():
-    await app.state.jagriti_service.close()
-
 
 @app.get("/documents/{document_id}")
-async def get_document(document_id: str, service: JagritiService = Depends(get_jagriti_service)):
-    data = service.get_document_bytes(document_id)
+async def get_document(document_id: str, service: ServiceDep):
+    data = await service.get_document_bytes(document_id)
     if not data:
         raise HTTPException(status_code=404, detail="Document not found")
-    return StreamingResponse(iter([data]), media_type="application/pdf")
+    return Response(
+        content=data,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'inline; filename="{document_id}.pdf"'}
+    )
 
 
 # Removed document streaming endpoint per requirement; links are direct absolute URLs for clients
@@ -119,4 +143,6 @@ if __name__ == "__main__":
         uvicorn.run("main:app", host=Config.HOST,
                     port=Config.PORT, reload=True)
     else:
-        uvicorn.run(app, host=Config.HOST, port=Config.PORT)
+        uvicorn.run("main:app", host=Config.HOST, port=Config.PORT,
+                    loop=Config.EVENT_LOOP, http="httptools",
+                    workers=Config.WORKERS, log_level="info")
@@ -1,28 +1,36 @@
-from typing import Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Union
+import msgspec
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from datetime import date
 from enum import Enum
 
+from utils import validate_search_value, validate_case_number
 
-class SearchType(str, Enum):
+
+class SearchType(int, Enum):
     """Search types for E-Jagriti API case searches.
 
-    Each enum maps to a numeric serchType value:
-    1 = CASE_NUMBER
-    2 = COMPLAINANT 
-    3 = RESPONDENT
-    4 = COMPLAINANT_ADVOCATE
-    5 = RESPONDENT_ADVOCATE
-    6 = INDUSTRY_TYPE
-    7 = JUDGE
+    Each member's value is the numeric serchType sent to E-Jagriti;
+    the portal's display label lives in SEARCH_TYPE_LABEL.
     """
-    CASE_NUMBER = "CASE NUMBER"
-    COMPLAINANT = "COMPLAINANT / APPELLANT /PETITIONER"
-    RESPONDENT = "RESPONDENT / OPPOSITE PARTY"
-    COMPLAINANT_ADVOCATE = "COMPLAINANT / APPELLANT /PETITIONER ADVOCATE"
-    RESPONDENT_ADVOCATE = "RESPONDENT / OPPOSITE PARTY ADVOCATE"
-    INDUSTRY_TYPE = "INDUSTRY TYPE"
-    JUDGE = "JUDGE"
+    CASE_NUMBER = 1
+    COMPLAINANT = 2
+    RESPONDENT = 3
+    COMPLAINANT_ADVOCATE = 4
+    RESPONDENT_ADVOCATE = 5
+    INDUSTRY_TYPE = 6
+    JUDGE = 7
+
+
+SEARCH_TYPE_LABEL = {
+    SearchType.CASE_NUMBER: "CASE NUMBER",
+    SearchType.COMPLAINANT: "COMPLAINANT / APPELLANT /PETITIONER",
+    SearchType.RESPONDENT: "RESPONDENT / OPPOSITE PARTY",
+    SearchType.COMPLAINANT_ADVOCATE: "COMPLAINANT / APPELLANT /PETITIONER ADVOCATE",
+    SearchType.RESPONDENT_ADVOCATE: "RESPONDENT / OPPOSITE PARTY ADVOCATE",
+    SearchType.INDUSTRY_TYPE: "INDUSTRY TYPE",
+    SearchType.JUDGE: "JUDGE",
+}
 
 
 class OrderType(str, Enum):
@@ -36,6 +44,8 @@ class CommissionType(str, Enum):
 
 
 class CaseSearchRequest(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     state_id: str = Field(..., description="State ID", examples=["11290000"])
     commission_id: str = Field(..., description="Commission ID", examples=[
                                "15290525"])
@@ -44,6 +54,15 @@ class CaseSearchRequest(BaseModel):
         default=date(2025, 1, 1), description="From date for case filing (optional)")
     to_date: Optional[date] = Field(
         default=None, description="To date for case filing (optional)")
+    include_documents: bool = Field(
+        default=True, description="Link documents embedded in the portal response (optional)")
+
+    @field_validator("search_value")
+    @classmethod
+    def _validate_search_value(cls, v: str) -> str:
+        if not validate_search_value(v):
+            raise ValueError("Invalid search value")
+        return v
 
 
 class CaseNumberSearchRequest(CaseSearchRequest):
@@ -54,8 +73,8 @@ class CaseNumberSearchRequest(CaseSearchRequest):
         ]
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "state_id": "11290000",
                 "commission_id": "15290525",
@@ -64,6 +83,14 @@ class CaseNumberSearchRequest(CaseSearchRequest):
                 "to_date": "2025-09-03"
             }
         }
+    )
+
+    @field_validator("search_value")
+    @classmethod
+    def _validate_search_value(cls, v: str) -> str:
+        if not validate_case_number(v):
+            raise ValueError("Invalid case number")
+        return v
 
 
 class ComplainantSearchRequest(CaseSearchRequest):
@@ -128,8 +155,12 @@ class ErrorResponse(BaseModel):
 # Internal Models for API communication
 
 
-class JagritiSearchPayload(BaseModel):
-    """Payload structure that matches E-Jagriti API exactly based on real API calls"""
+class JagritiSearchPayload(msgspec.Struct, kw_only=True):
+    """Payload structure that matches E-Jagriti API exactly based on real API calls
+
+    A msgspec Struct rather than a Pydantic model: it is built from already
+    validated values and encoded straight to JSON bytes for every search.
+    """
     commissionId: int  # Numeric commission ID
     dateRequestType: int = 1  # Always 1 for CASE_FILING_DATE
     fromDate: str  # YYYY-MM-DD format (ISO)
@@ -139,3 +170,64 @@ class JagritiSearchPayload(BaseModel):
     # 1-7 for different search types (note: 'serch' not 'search')
     serchType: int
     serchTypeValue: str  # The actual search value
+
+
+# E-Jagriti response schemas, decoded straight from JSON bytes by msgspec.
+# Unknown fields are ignored; everything is optional because the portal
+# omits or nulls fields freely.
+
+
+class JagritiCaseLite(msgspec.Struct):
+    """Case entry from getCaseDetailsBySearchType without embedded documents
+
+    Decoding into this skips the base64 fields instead of allocating them.
+    """
+    caseNumber: Optional[str] = None
+    caseStageName: Optional[str] = None
+    caseFilingDate: Optional[str] = None
+    complainantName: Optional[str] = None
+    complainantAdvocateName: Optional[str] = None
+    respondentName: Optional[str] = None
+    respondentAdvocateName: Optional[str] = None
+    orderDocumentPath: Optional[str] = None
+
+
+class JagritiCase(JagritiCaseLite):
+    """Case entry from getCaseDetailsBySearchType"""
+    documentBase64: Optional[str] = None
+    judgmentOrderDocumentBase64: Optional[str] = None
+
+
+class JagritiCaseList(msgspec.Struct):
+    cases: List[JagritiCase] = []
+
+
+class JagritiSearchResponse(msgspec.Struct):
+    status: Optional[int] = None
+    # The portal returns either {"cases": [...]} or a bare list
+    data: Union[JagritiCaseList, List[JagritiCase], None] = None
+
+
+class JagritiCaseLiteList(msgspec.Struct):
+    cases: List[JagritiCaseLite] = []
+
+
+class JagritiSearchLiteResponse(msgspec.Struct):
+    status: Optional[int] = None
+    data: Union[JagritiCaseLiteList, List[JagritiCaseLite], None] = None
+
+
+class JagritiCommission(msgspec.Struct):
+    """Commission entry from the state/district commission reports"""
+    commissionId: Union[int, str, None] = None
+    commissionNameEn: Optional[str] = None
+    # Only tested for truthiness; the portal isn't consistent about 1/"true"
+    activeStatus: Union[bool, int, str, None] = None
+    circuitAdditionBenchStatus: Union[bool, int, str, None] = None
+
+
+class JagritiCommissionResponse(msgspec.Struct):
+    status: Optional[int] = None
+    error: Union[str, bool, None] = None
+    message: Optional[str] = None
+    data: List[JagritiCommission] = []
@@ -4,10 +4,21 @@ from main import app
 from config import Config
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "main:app",
-        host=Config.HOST,
-        port=Config.PORT,
-        reload=Config.DEBUG,
-        log_level="info" if not Config.DEBUG else "debug"
-    )
+    if Config.DEBUG:
+        uvicorn.run(
+            "main:app",
+            host=Config.HOST,
+            port=Config.PORT,
+            reload=True,
+            log_level="debug"
+        )
+    else:
+        uvicorn.run(
+            "main:app",
+            host=Config.HOST,
+            port=Config.PORT,
+            loop=Config.EVENT_LOOP,
+            http="httptools",
+            workers=Config.WORKERS,
+            log_level="info"
+        )
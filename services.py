@@ -1,12 +1,17 @@
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, List, Dict, Optional, Tuple, Union
+import asyncio
 import httpx
 import logging
-import base64
+import pybase64
 import hashlib
+import msgspec
+from cachetools import LRUCache, TTLCache
 
 from models import (
     CaseResponse, StateResponse, CommissionResponse,
-    SearchType, JagritiSearchPayload, CaseSearchRequest
+    SearchType, JagritiSearchPayload, CaseSearchRequest,
+    JagritiSearchResponse, JagritiSearchLiteResponse, JagritiCommission,
+    JagritiCommissionResponse
 )
 from config import Config
 from utils import (
@@ -16,212 +21,294 @@ from utils import (
 
 logger = logging.getLogger(__name__)
 
+_encode_json = msgspec.json.Encoder().encode
+_MISSING = object()
+
+# Search-specific headers on top of the client defaults
+_SEARCH_HEADERS = {
+    "Content-Type": "application/json",
+    "Referer": Config.JAGRITI_SEARCH_URL,
+    "Origin": Config.JAGRITI_BASE_URL
+}
+_decode_search_response = msgspec.json.Decoder(JagritiSearchResponse).decode
+_decode_search_response_lite = msgspec.json.Decoder(
+    JagritiSearchLiteResponse).decode
+_decode_commission_response = msgspec.json.Decoder(
+    JagritiCommissionResponse).decode
+
+
+def _document_id(encoded: str) -> str:
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+def _commission_id(item: JagritiCommission) -> str:
+    return "" if item.commissionId is None else str(item.commissionId)
+
 
 class JagritiService:
     def __init__(self):
         self.base_url = Config.JAGRITI_BASE_URL
         self.search_url = Config.JAGRITI_SEARCH_URL
-        self.client = httpx.AsyncClient(timeout=Config.REQUEST_TIMEOUT)
-        self._states_cache = None
-        self._commissions_cache = {}
-        self._document_store: Dict[str, bytes] = {}
+        # One pooled client for the process lifetime; pool and HTTP/2 settings
+        # live on the transport because httpx ignores them on the client
+        # when an explicit transport is passed
+        self.client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=Config.REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=Config.MAX_CONNECTIONS,
+                    max_keepalive_connections=Config.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=Config.KEEPALIVE_EXPIRY
+                ),
+                retries=Config.MAX_RETRIES
+            ),
+            # Browser-like headers sent with every portal request
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+                "Accept": "application/json, text/plain, */*",
+                "Accept-Language": "en-US,en;q=0.9",
+                "Referer": f"{self.base_url}/"
+            }
+        )
+        self._metadata_cache = TTLCache(
+            maxsize=Config.CACHE_MAXSIZE, ttl=Config.CACHE_TTL)
+        self._search_cache = TTLCache(
+            maxsize=Config.CACHE_MAXSIZE, ttl=Config.SEARCH_CACHE_TTL)
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        # Base64 documents by ID, plus a small LRU of recently decoded ones
+        self._document_store = TTLCache(
+            maxsize=Config.DOCUMENT_STORE_MAX_CHARS, ttl=Config.DOCUMENT_STORE_TTL, getsizeof=len)
+        link_host = "localhost" if Config.HOST in (
+            "0.0.0.0", "127.0.0.1") else Config.HOST
+        self._doc_url_prefix = f"http://{link_host}:{Config.PORT}/documents/"
+        self._decoded_documents = LRUCache(maxsize=Config.DOCUMENT_CACHE_SIZE)
 
         # Real-time data will be fetched from Jagriti API
         # No more static mappings - everything is dynamic now
 
+    async def _get_or_fetch(self, cache: TTLCache, key: Tuple, fetch: Callable[[], Awaitable[Optional[list]]],
+                            cache_empty: bool = False) -> list:
+        """Return a cached value or fetch it, letting only one caller per key hit the upstream"""
+        # One lookup: an entry can expire between `in` and `[]`
+        result = cache.get(key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        # Concurrent callers on a cold key all await the same in-flight fetch.
+        # It runs as its own task and is shielded, so a caller that gets
+        # cancelled doesn't cancel the fetch for everyone else.
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch_into(cache, key, fetch, cache_empty))
+            self._inflight[key] = task
+        return await asyncio.shield(task)
+
+    async def _fetch_into(self, cache: TTLCache, key: Tuple, fetch: Callable[[], Awaitable[Optional[list]]],
+                          cache_empty: bool) -> list:
+        try:
+            result = await fetch()
+            # None marks a failed fetch. Empty metadata lists usually mean an
+            # upstream failure too, so they are only pinned with cache_empty.
+            if result is None:
+                return []
+            if result or cache_empty:
+                cache[key] = result
+            return result
+        finally:
+            del self._inflight[key]
+
     async def get_states(self) -> List[StateResponse]:
         """Get list of all available states"""
-        if self._states_cache is not None:
-            return self._states_cache
-
         try:
             # Fetch real states from Jagriti portal API
-            real_states = await self._fetch_real_states()
+            real_states = await self._get_or_fetch(
+                self._metadata_cache, ("states",), self._fetch_real_states)
             if real_states:
-                self._states_cache = real_states
                 return real_states
             else:
                 logger.error("No states returned from Jagriti API")
                 return []
+        except httpx.HTTPError:
+            raise
         except Exception as e:
-            logger.error(f"Failed to fetch states from Jagriti API: {str(e)}")
+            logger.error("Failed to fetch states from Jagriti API: %s", e)
             return []
 
     async def get_commissions(self, state_id: str) -> List[CommissionResponse]:
         """Get list of commissions for a given state"""
-        if state_id in self._commissions_cache:
-            return self._commissions_cache[state_id]
-
         try:
             # Fetch real commissions from Jagriti portal API
-            real_commissions = await self._fetch_real_commissions(state_id)
+            real_commissions = await self._get_or_fetch(
+                self._metadata_cache, ("commissions", state_id),
+                lambda: self._fetch_real_commissions(state_id))
             if real_commissions:
-                self._commissions_cache[state_id] = real_commissions
                 return real_commissions
             else:
                 logger.error(
-                    f"No commissions returned from Jagriti API for state {state_id}")
+                    "No commissions returned from Jagriti API for state %s", state_id)
                 return []
+        except httpx.HTTPError:
+            raise
         except Exception as e:
             logger.error(
-                f"Failed to fetch commissions for state {state_id}: {str(e)}")
+                "Failed to fetch commissions for state %s: %s", state_id, e)
             return []
 
     async def _get_state_id(self, state_name: str) -> Optional[str]:
         """Get state ID from state name using cached real API data"""
         normalized_name = normalize_state_name(state_name)
 
-        # Ensure states are loaded
-        if self._states_cache is None:
-            await self.get_states()
-
         # Search in cached states from real API
-        if self._states_cache:
-            for state in self._states_cache:
-                if state.state_name == normalized_name:
-                    return state.state_id
+        for state in await self.get_states():
+            if state.state_name == normalized_name:
+                return state.state_id
 
         # No fallback - only real data
-        logger.warning(f"State '{state_name}' not found in real API data")
+        logger.warning("State '%s' not found in real API data", state_name)
         return None
 
     async def _get_commission_id(self, state_id: str, commission_name: str) -> Optional[str]:
         """Get commission ID from commission name using cached real API data"""
         normalized_name = normalize_commission_name(commission_name)
 
-        # Ensure commissions are loaded for this state
-        if state_id not in self._commissions_cache:
-            await self.get_commissions(state_id)
-
         # Search in cached commissions from real API
-        cached_commissions = self._commissions_cache.get(state_id, [])
-        for commission in cached_commissions:
-            if commission.commission_name.upper() == normalized_name.upper():
+        for commission in await self.get_commissions(state_id):
+            if commission.commission_name.upper() == normalized_name:
                 return commission.commission_id
 
         # No fallback - only real data
         logger.warning(
-            f"Commission '{commission_name}' not found for state {state_id} in real API data")
+            "Commission '%s' not found for state %s in real API data", commission_name, state_id)
         return None
 
-    async def _make_jagriti_request(self, payload: JagritiSearchPayload) -> Dict:
+    async def _make_jagriti_request(self, payload: JagritiSearchPayload,
+                                    include_documents: bool = True) -> Dict:
         """Make request to E-Jagriti API using the correct endpoint and payload structure"""
         try:
-            # Set up headers for JSON API request
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Content-Type": "application/json",
-                "Referer": "https://e-jagriti.gov.in/advance-case-search",
-                "Origin": "https://e-jagriti.gov.in"
-            }
-
             # Use the correct E-Jagriti API endpoint for case search
-            api_endpoint = f"{self.base_url}/services/case/caseFilingService/v2/getCaseDetailsBySearchType"
-
-            # Convert our payload to exact format expected by E-Jagriti API (from response.json)
-            api_payload = {
-                "commissionId": payload.commissionId,
-                "dateRequestType": payload.dateRequestType,
-                "fromDate": payload.fromDate,
-                "toDate": payload.toDate,
-                "judgeId": payload.judgeId,
-                "orderType": payload.orderType,
-                "serchType": payload.serchType,  # Note: 'serch' not 'search' - matches real API
-                "serchTypeValue": payload.serchTypeValue  # Note: 'serch' not 'search'
-            }
+            api_endpoint = "/services/case/caseFilingService/v2/getCaseDetailsBySearchType"
 
+            # Field names already match the E-Jagriti API exactly (including 'serch')
             logger.info(
-                f"Making request to E-Jagriti API with payload: {api_payload}")
+                "Making request to E-Jagriti API with payload: %s", payload)
 
             response = await self.client.post(
                 api_endpoint,
-                json=api_payload,
-                headers=headers
+                content=_encode_json(payload),
+                headers=_SEARCH_HEADERS
             )
 
             logger.info(
-                f"E-Jagriti API response status: {response.status_code}")
+                "E-Jagriti API response status: %s", response.status_code)
 
             if response.status_code != 200:
                 logger.error(
-                    f"E-Jagriti API request failed with status {response.status_code}")
-                logger.error(f"Response content: {response.text}")
+                    "E-Jagriti API request failed with status %s", response.status_code)
+                logger.error("Response content: %s", response.text)
                 return {"status": "error", "cases": []}
 
-            # Parse JSON response from E-Jagriti API
-            response_data = response.json()
-            logger.info(f"E-Jagriti API response: {response_data}")
+            # Parse JSON response from E-Jagriti API; without documents the
+            # base64 fields are skipped rather than decoded into strings
+            if include_documents:
+                response_data = _decode_search_response(response.content)
+            else:
+                response_data = _decode_search_response_lite(response.content)
+            # The raw response can embed megabytes of base64 documents
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("E-Jagriti API response: %s", response_data)
 
-            return self._parse_api_response(response_data)
+            return await self._parse_api_response(response_data, include_documents)
 
+        except httpx.HTTPError as e:
+            # Transport failures reach the routes, which answer 502
+            logger.error("Error making E-Jagriti API request: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Error making E-Jagriti API request: {str(e)}")
+            logger.error("Error making E-Jagriti API request: %s", e)
             # Return empty result on error rather than failing completely
             return {"status": "error", "cases": []}
 
-    def _parse_api_response(self, response_data: Dict) -> Dict:
+    async def _parse_api_response(self, response_data: Union[JagritiSearchResponse, JagritiSearchLiteResponse],
+                                  include_documents: bool = True) -> Dict:
         """Parse JSON response from E-Jagriti API"""
         try:
             # Check if response indicates success
-            if response_data.get('status') != 200:
+            if response_data.status != 200:
                 logger.warning(
-                    f"E-Jagriti API returned non-success status: {response_data.get('status')}")
+                    "E-Jagriti API returned non-success status: %s", response_data.status)
                 return {"status": "error", "cases": []}
 
             # Extract cases data from the response
-            cases_data = response_data.get('data', {})
-
-            if isinstance(cases_data, dict):
-                cases_list = cases_data.get('cases', [])
+            cases_data = response_data.data
+            if cases_data is None:
+                cases_list = []
             elif isinstance(cases_data, list):
                 cases_list = cases_data
             else:
-                logger.warning(
-                    f"Unexpected data format in E-Jagriti response: {type(cases_data)}")
-                return {"status": "error", "cases": []}
+                cases_list = cases_data.cases
 
             # Process each case - using actual field names from E-Jagriti API response
             processed_cases = []
+            # Loop invariants bound to locals for the per-case loop
+            append = processed_cases.append
+            store = self._document_store
+            url_prefix = self._doc_url_prefix
+            max_len = Config.MAX_DOC_B64_LEN
+            thread_min = Config.DOC_DECODE_THREAD_MIN
             for case in cases_list:
-                document_link = case.get("orderDocumentPath") or ""
-                if not document_link:
-                    base64_doc = case.get("documentBase64") or case.get(
-                        "judgmentOrderDocumentBase64")
+                document_link = case.orderDocumentPath or ""
+                if not document_link and include_documents:
+                    base64_doc = case.documentBase64 or case.judgmentOrderDocumentBase64
                     if base64_doc:
                         try:
-                            normalized = base64_doc.split(",")[-1].strip()
-                            document_bytes = base64.b64decode(
-                                normalized, validate=False)
-                            if document_bytes:
-                                document_id = hashlib.sha256(
-                                    document_bytes).hexdigest()[:32]
-                                self._document_store[document_id] = document_bytes
-                                link_host = "localhost" if Config.HOST in (
-                                    "0.0.0.0", "127.0.0.1") else Config.HOST
-                                document_link = f"http://{link_host}:{Config.PORT}/documents/{document_id}"
+                            # Checked before slicing so oversized payloads
+                            # aren't copied again
+                            if len(base64_doc) > max_len:
+                                logger.warning(
+                                    "Skipping base64 document of %s chars for case %s", len(base64_doc), case.caseNumber)
+                                normalized = ""
+                            else:
+                                # Drop a "data:...;base64," prefix if present
+                                # (rfind gives -1 without one, slicing from 0)
+                                normalized = base64_doc[base64_doc.rfind(
+                                    ",") + 1:].strip()
+                            if len(normalized) % 4:
+                                # Truncated or unpadded; it would never decode
+                                logger.warning(
+                                    "Skipping malformed base64 document for case %s", case.caseNumber)
+                            elif normalized:
+                                # Keep the encoded form; it is only decoded
+                                # if the document is actually requested.
+                                # Large ones are hashed off the event loop.
+                                if len(normalized) >= thread_min:
+                                    document_id = await asyncio.to_thread(_document_id, normalized)
+                                else:
+                                    document_id = _document_id(normalized)
+                                store[document_id] = normalized
+                                document_link = url_prefix + document_id
                         except Exception:
                             document_link = ""
 
-                processed_case = {
-                    "case_number": case.get("caseNumber") or "",
-                    "case_stage": case.get("caseStageName") or "",
-                    "filing_date": case.get("caseFilingDate") or "",
-                    "complainant": case.get("complainantName") or "",
-                    "complainant_advocate": case.get("complainantAdvocateName") or "",
-                    "respondent": case.get("respondentName") or "",
-                    "respondent_advocate": case.get("respondentAdvocateName") or "",
+                append({
+                    "case_number": case.caseNumber or "",
+                    "case_stage": case.caseStageName or "",
+                    "filing_date": case.caseFilingDate or "",
+                    "complainant": case.complainantName or "",
+                    "complainant_advocate": case.complainantAdvocateName or "",
+                    "respondent": case.respondentName or "",
+                    "respondent_advocate": case.respondentAdvocateName or "",
                     "document_link": document_link
-                }
-                processed_cases.append(processed_case)
+                })
 
             logger.info(
-                f"Successfully parsed {len(processed_cases)} cases from E-Jagriti API")
+                "Successfully parsed %s cases from E-Jagriti API", len(processed_cases))
             return {"status": "success", "cases": processed_cases}
 
         except Exception as e:
-            logger.error(f"Error parsing E-Jagriti API response: {str(e)}")
+            logger.error("Error parsing E-Jagriti API response: %s", e)
             return {"status": "error", "cases": []}
 
     # Removed unused HTML parsing logic as API uses JSON endpoints exclusively
@@ -230,41 +317,32 @@ class JagritiService:
         """Fetch real state data from Jagriti portal API"""
         try:
             # Use the real Jagriti API endpoint for states/commissions
-            api_url = "https://e-jagriti.gov.in/services/report/report/getStateCommissionAndCircuitBench"
+            api_url = "/services/report/report/getStateCommissionAndCircuitBench"
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Referer": "https://e-jagriti.gov.in/"
-            }
-
-            response = await self.client.get(api_url, headers=headers)
+            response = await self.client.get(api_url)
             if response.status_code != 200:
                 logger.warning(
-                    f"API request failed with status {response.status_code}")
+                    "API request failed with status %s", response.status_code)
                 return []
 
             # Parse JSON response
-            data = response.json()
-            if data.get('error') != 'false' or data.get('status') != 200:
+            data = _decode_commission_response(response.content)
+            if data.error != 'false' or data.status != 200:
                 logger.warning(
-                    f"API returned error: {data.get('message', 'Unknown error')}")
+                    "API returned error: %s", data.message or 'Unknown error')
                 return []
 
             states = []
             seen_states = set()
 
             # Process the data to extract unique states (excluding circuit benches for states list)
-            for item in data.get('data', []):
-                if not item.get('activeStatus', False):
+            for item in data.data:
+                if not item.activeStatus:
                     continue
 
-                commission_name = item.get(
-                    'commissionNameEn', '').strip().upper()
-                commission_id = str(item.get('commissionId', ''))
-                is_circuit_bench = item.get(
-                    'circuitAdditionBenchStatus', False)
+                commission_name = (item.commissionNameEn or '').strip().upper()
+                commission_id = _commission_id(item)
+                is_circuit_bench = item.circuitAdditionBenchStatus
 
                 # For states list, we want main states, not circuit benches
                 if not is_circuit_bench and commission_name and commission_id:
@@ -275,84 +353,86 @@ class JagritiService:
                         ))
                         seen_states.add(commission_name)
 
-            logger.info(f"Fetched {len(states)} real states from Jagriti API")
+            logger.info("Fetched %s real states from Jagriti API", len(states))
             return states
 
+        except httpx.HTTPError as e:
+            # Transport failures reach the routes, which answer 502
+            logger.error("Error fetching real states from API: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Error fetching real states from API: {str(e)}")
+            logger.error("Error fetching real states from API: %s", e)
             return []
 
     async def _fetch_real_commissions(self, state_id: str) -> List[CommissionResponse]:
         """Fetch real commission data for a state from Jagriti portal API"""
         try:
             # Use the real Jagriti API endpoint for district commissions
-            api_url = "https://e-jagriti.gov.in/services/report/report/getDistrictCommissionByCommissionId"
+            api_url = "/services/report/report/getDistrictCommissionByCommissionId"
             params = {"commissionId": state_id}
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Referer": "https://e-jagriti.gov.in/"
-            }
-
-            response = await self.client.get(api_url, params=params, headers=headers)
+            response = await self.client.get(api_url, params=params)
 
             if response.status_code != 200:
                 logger.error(
-                    f"Failed to fetch commissions for state {state_id}: HTTP {response.status_code}")
+                    "Failed to fetch commissions for state %s: HTTP %s", state_id, response.status_code)
                 return []
 
-            data = response.json()
+            data = _decode_commission_response(response.content)
 
-            if data.get('error') != 'false' or data.get('status') != 200:
+            if data.error != 'false' or data.status != 200:
                 logger.error(
-                    f"API error for state {state_id}: {data.get('message', 'Unknown error')}")
+                    "API error for state %s: %s", state_id, data.message or 'Unknown error')
                 return []
 
             commissions = []
-            commission_data = data.get('data', [])
+            commission_data = data.data
 
             logger.info(
-                f"Fetched {len(commission_data)} commissions for state {state_id}")
+                "Fetched %s commissions for state %s", len(commission_data), state_id)
 
             for item in commission_data:
-                if item.get('activeStatus', False):  # Only include active commissions
+                if item.activeStatus:  # Only include active commissions
                     commissions.append(CommissionResponse(
-                        commission_id=str(item.get('commissionId', '')),
-                        commission_name=item.get('commissionNameEn', ''),
+                        commission_id=_commission_id(item),
+                        commission_name=item.commissionNameEn or '',
                         state_id=state_id
                     ))
 
             return commissions
 
+        except httpx.HTTPError as e:
+            # Transport failures reach the routes, which answer 502
+            logger.error("Error fetching real commissions from API: %s", e)
+            raise
         except Exception as e:
-            logger.error(f"Error fetching real commissions from API: {str(e)}")
+            logger.error("Error fetching real commissions from API: %s", e)
             return []
 
     def _parse_cases(self, api_response: Dict) -> List[CaseResponse]:
         """Parse API response into CaseResponse objects"""
-        cases = []
-
         if api_response.get("status") != "success":
-            return cases
+            return []
 
-        for case_data in api_response.get("cases", []):
-            case = CaseResponse(
-                case_number=clean_text(case_data.get("case_number", "")),
-                case_stage=clean_text(case_data.get("case_stage", "")),
+        # Fields were already normalized to strings by _parse_api_response,
+        # so skip Pydantic validation and build the models directly
+        construct = CaseResponse.model_construct
+        _ct = clean_text
+        return [
+            construct(
+                case_number=_ct(case_data.get("case_number", "")),
+                case_stage=_ct(case_data.get("case_stage", "")),
                 filing_date=case_data.get("filing_date", ""),
-                complainant=clean_text(case_data.get("complainant", "")),
-                complainant_advocate=clean_text(
+                complainant=_ct(case_data.get("complainant", "")),
+                complainant_advocate=_ct(
                     case_data.get("complainant_advocate", "")),
-                respondent=clean_text(case_data.get("respondent", "")),
-                respondent_advocate=clean_text(
+                respondent=_ct(case_data.get("respondent", "")),
+                respondent_advocate=_ct(
                     case_data.get("respondent_advocate", "")),
                 document_link=case_data.get("document_link", "")
             )
-            cases.append(case)
-
-        return cases
+            for case_data in api_response.get("cases", [])
+        ]
 
     async def search_cases(self, request: CaseSearchRequest, search_type: SearchType) -> List[CaseResponse]:
         """Search cases using the specified search type"""
@@ -370,36 +450,70 @@ class JagritiService:
             from_date = request.from_date
             to_date = request.to_date
 
-        # Map search type to numeric serchType value (1-7)
-        search_type_mapping = {
-            SearchType.CASE_NUMBER: 1,
-            SearchType.COMPLAINANT: 2,
-            SearchType.RESPONDENT: 3,
-            SearchType.COMPLAINANT_ADVOCATE: 4,
-            SearchType.RESPONDENT_ADVOCATE: 5,
-            SearchType.INDUSTRY_TYPE: 6,
-            SearchType.JUDGE: 7
-        }
-
         # Create payload for E-Jagriti API using the exact structure from response.json
         payload = JagritiSearchPayload(
             commissionId=int(commission_id),
             fromDate=format_date_for_jagriti(from_date),
             toDate=format_date_for_jagriti(to_date),
-            serchType=search_type_mapping[search_type],
+            serchType=int(search_type),
             serchTypeValue=request.search_value
         )
 
+        cache_key = (payload.commissionId, payload.fromDate, payload.toDate,
+                     payload.serchType, payload.serchTypeValue, request.include_documents)
+        # Searches with no hits are cached too; only failures are retried
+        return await self._get_or_fetch(
+            self._search_cache, cache_key,
+            lambda: self._search(payload, request.include_documents),
+            cache_empty=True)
+
+    async def _search(self, payload: JagritiSearchPayload, include_documents: bool) -> Optional[List[CaseResponse]]:
         # Make API request
-        api_response = await self._make_jagriti_request(payload)
+        api_response = await self._make_jagriti_request(payload, include_documents)
+        if api_response.get("status") != "success":
+            return None
 
         # Parse and return cases
         return self._parse_cases(api_response)
 
+    async def warmup(self):
+        """Open pooled connections to the portal and prime the states cache"""
+        async def _connect():
+            try:
+                await self.client.head(self.base_url)
+            except httpx.HTTPError as e:
+                logger.warning("Warmup request to Jagriti portal failed: %s", e)
+
+        async def _prime_states():
+            try:
+                await self.get_states()
+            except httpx.HTTPError as e:
+                logger.warning("Warmup states fetch failed: %s", e)
+
+        await asyncio.gather(_connect(), _prime_states())
+
     async def close(self):
         """Clean up resources"""
         await self.client.aclose()
 
-    def get_document_bytes(self, document_id: str) -> Optional[bytes]:
+    async def get_document_bytes(self, document_id: str) -> Optional[bytes]:
         """Return stored document bytes for the given ID, if available"""
-        return self._document_store.get(document_id)
+        data = self._decoded_documents.get(document_id)
+        if data is not None:
+            return data
+
+        encoded = self._document_store.get(document_id)
+        if encoded is None:
+            return None
+        try:
+            # Keep large decodes off the event loop
+            if len(encoded) >= Config.DOC_DECODE_THREAD_MIN:
+                data = await asyncio.to_thread(pybase64.b64decode, encoded, validate=False)
+            else:
+                data = pybase64.b64decode(encoded, validate=False)
+        except ValueError as e:
+            logger.warning("Could not decode document %s: %s", document_id, e)
+            return None
+        if data:
+            self._decoded_documents[document_id] = data
+        return data
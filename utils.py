@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from datetime import date, timedelta
+from functools import lru_cache
 import re
 
 
@@ -6,23 +7,34 @@ def format_date_for_jagriti(date_obj) -> str:
     """Format date object to string format expected by Jagriti API (ISO format)"""
     if date_obj is None:
         return ""
-    return date_obj.strftime("%Y-%m-%d")
+    return f"{date_obj.year:04d}-{date_obj.month:02d}-{date_obj.day:02d}"
+
+
+@lru_cache(maxsize=1)
+def _date_range_ending(end_date: date):
+    return end_date - timedelta(days=30), end_date
 
 
 def get_default_date_range():
     """Get default date range (last 30 days)"""
-    end_date = datetime.now().date()
-    start_date = end_date - timedelta(days=30)
-    return start_date, end_date
+    # Only recomputed when the day changes
+    return _date_range_ending(date.today())
+
+
+_WHITESPACE_RE = re.compile(r'\s+')
 
 
 def clean_text(text: str) -> str:
     """Clean and normalize text data"""
     if not text:
         return ""
+    text = text.strip()
+    # Only single ASCII spaces left (every other whitespace char is
+    # non-printable), so there is nothing to collapse
+    if "  " not in text and text.isprintable():
+        return text
     # Remove extra whitespace and normalize
-    text = re.sub(r'\s+', ' ', text.strip())
-    return text
+    return _WHITESPACE_RE.sub(' ', text)
 
 
 def normalize_state_name(state_name: str) -> str:
@@ -31,12 +43,25 @@ def normalize_state_name(state_name: str) -> str:
 
 
 def normalize_commission_name(commission_name: str) -> str:
-    """Normalize commission name to match Jagriti format"""
-    return commission_name.strip()
+    """Normalize commission name for case-insensitive lookups"""
+    return commission_name.strip().upper()
+
+
+# At least two non-whitespace characters
+_SEARCH_VALUE_RE = re.compile(r"\S\s*\S")
+# Slash-separated case number, e.g. DC/AB4/525/CC/72/2025
+_CASE_NUMBER_RE = re.compile(r"[A-Za-z0-9-]+(?:/[A-Za-z0-9-]+)+")
 
 
 def validate_search_value(search_value: str) -> bool:
     """Validate search value"""
-    if not search_value or len(search_value.strip()) < 2:
+    if not search_value:
+        return False
+    return _SEARCH_VALUE_RE.search(search_value) is not None
+
+
+def validate_case_number(case_number: str) -> bool:
+    """Validate case number format"""
+    if not case_number:
         return False
-    return True
+    return _CASE_NUMBER_RE.fullmatch(case_number.strip()) is not None